@@ -4,10 +4,7 @@ import os
 import streamlit as st
 
 # Import our modularized utility functions
-from utils.analyzer import run_flake8_check
-from utils.formatter import run_black_format
-from utils.complexity import run_complexity_analysis
-from utils.report import save_as_json, save_as_text, save_as_pdf
+from utils.pipeline import run_review
 
 # -------------------------------------------------
 # 1. Configuration & Global Styles
@@ -82,6 +79,7 @@ with st.sidebar:
     
     st.markdown("### ⚙️ Settings")
     st.checkbox("Show Line Numbers", value=True, key="show_lines")
+    st.checkbox("⚡ Quick Lint (E111, E225, E231 only)", value=False, key="quick_lint")
     st.info("Powered by Flake8, Black & Radon")
 
 # -------------------------------------------------
@@ -119,27 +117,21 @@ if st.button("✨ Analyze & Optimize Code", type="primary"):
     progress_text = "Operation in progress. Please wait..."
     my_bar = st.progress(0, text=progress_text)
     
-    # 1. Run Style Check
-    my_bar.progress(30, text="Checking Style Guidelines (Flake8)...")
-    style_issues = run_flake8_check(code_input)
-    
-    # 2. Run Formatting
-    my_bar.progress(60, text="Formatting Code (Black)...")
-    formatted_code = run_black_format(code_input)
-    
-    # 3. Run Complexity
-    my_bar.progress(90, text="Calculating Cognitive Complexity (Radon)...")
-    complexity_data = run_complexity_analysis(code_input)
-    
-    my_bar.progress(100, text="Analysis Complete!")
+    # Style check, formatting, complexity and report exports (shared with load_harness.py)
+    quick_lint = st.session_state.quick_lint
+    review = run_review(
+        code_input,
+        filename,
+        quick_lint=quick_lint,
+        progress=lambda percent, text: my_bar.progress(percent, text=text)
+    )
     my_bar.empty()
 
-    # Aggregate results
-    full_results = {
-        "style_issues": style_issues,
-        "complexity": complexity_data,
-        "black_preview": formatted_code
-    }
+    style_issues = review["style_issues"]
+    complexity_data = review["complexity"]
+    formatted_code = review["black_preview"]
+    pdf_path = review["pdf_path"]
+    json_path = review["json_path"]
 
     # -------------------------------------------------
     # 5. Dashboard Results (Linear Layout)
@@ -154,7 +146,10 @@ if st.button("✨ Analyze & Optimize Code", type="primary"):
     mi_score = complexity_data.get("maintainability_index", 0)
     mi_rank = complexity_data.get("mi_rank", "N/A")
     
-    m1.metric("Style Violations", issue_count, delta="Lower is better", delta_color="inverse")
+    m1.metric(
+        "Style Violations (Quick Lint)" if quick_lint else "Style Violations",
+        issue_count, delta="Lower is better", delta_color="inverse"
+    )
     m2.metric("Maintainability Index", f"{mi_score}", delta="Target: >50")
     m3.metric("Health Grade", mi_rank)
     m4.metric("Lines of Code", len(code_input.splitlines()))
@@ -177,8 +172,12 @@ if st.button("✨ Analyze & Optimize Code", type="primary"):
     
     with c1:
         st.subheader("🐞 Style Issues Found")
+        if quick_lint:
+            # Partial check - an empty list here is not a clean bill of health
+            st.info("⚡ Quick Lint only checked E111, E225 and E231. Turn it off for a full Flake8 review.")
         if not style_issues:
-            st.success("🎉 No issues found! Excellent work.")
+            if not quick_lint:
+                st.success("🎉 No issues found! Excellent work.")
         else:
             with st.expander("View all style violations", expanded=True):
                 for issue in style_issues:
@@ -204,10 +203,6 @@ if st.button("✨ Analyze & Optimize Code", type="primary"):
     st.divider()
     st.subheader("📥 Download Reports & Code")
     
-    # Generate files
-    pdf_path = save_as_pdf(code_input, formatted_code, full_results, filename)
-    json_path = save_as_json(full_results, filename)
-    
     b1, b2, b3 = st.columns(3)
     
     with b1:
@@ -0,0 +1,510 @@
+# load_harness.py
+
+"""
+Concurrent-user load and soak harness for the AI Code Reviewer.
+
+Drives the same analysis pipeline app.py runs on "Analyze & Optimize"
+(Flake8 -> Black -> Radon -> PDF + JSON export) from N simulated sessions
+at once, using the files in sample_code/ and test_codes/ as input.
+
+While it runs it samples memory (RSS), open file descriptors, leftover
+analyzer temp files and the size of the reports folder. Reports use the
+same names app.py gives them, and every report read back is checked to
+belong to the request that wrote it. At the end it prints throughput and
+latency numbers and exits with code 1 if any bound is passed.
+
+Examples:
+    python load_harness.py --sessions 8 --duration 60
+    python load_harness.py --sessions 20 --duration 14400 --max-rss-growth-mb 50
+"""
+
+import os
+import sys
+import glob
+import json
+import math
+import time
+import shutil
+import argparse
+import tempfile
+import threading
+import logging
+from array import array
+
+from utils.pipeline import run_review
+from utils import report
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+SAMPLE_DIRS = ["sample_code", "test_codes"]
+
+# app.py names reports after the uploaded file, or this for pasted code
+PASTED_FILENAME = "manual_input"
+
+
+class ReportCollision(RuntimeError):
+    """A report read back for download belongs to a different request."""
+
+
+# --------------------------------------------------
+# 1. Input Samples
+# --------------------------------------------------
+def load_samples():
+    """
+    Reads every Python file from sample_code/ and test_codes/.
+
+    Returns:
+        list: (filename, source) tuples.
+    """
+    samples = []
+    for folder in SAMPLE_DIRS:
+        for path in sorted(glob.glob(os.path.join(BASE_DIR, folder, "*.py"))):
+            with open(path, "r", encoding="utf-8") as f:
+                samples.append((os.path.basename(path).replace(".py", ""), f.read()))
+    return samples
+
+
+# --------------------------------------------------
+# 2. One Simulated "Analyze & Optimize" Click
+# --------------------------------------------------
+def simulate_click(code_text: str, filename: str, quick: bool = False) -> dict:
+    """
+    Runs the shared review pipeline app.py uses for one button click, then
+    reads the PDF / JSON reports back the way the download buttons do.
+
+    The analysis steps report failures in their results instead of raising,
+    so those are turned into exceptions here to count as errors.
+
+    Args:
+        code_text (str): The Python source code to review.
+        filename (str): Base name used for the generated reports.
+        quick (bool): Use the Quick Lint check instead of Flake8.
+
+    Returns:
+        dict: The review results from utils.pipeline.run_review().
+
+    Raises:
+        ReportCollision: The JSON report on disk holds another request's results,
+            i.e. a concurrent session overwrote it. The PDF shares its name and
+            timestamp, so it is overwritten at the same time.
+    """
+    review = run_review(code_text, filename, quick_lint=quick)
+
+    critical = [i["message"] for i in review["style_issues"] if i["code"] == "CRITICAL"]
+    if critical:
+        raise RuntimeError(f"Style check failed: {critical[0]}")
+    if review["black_preview"].startswith("# ERROR:"):
+        raise RuntimeError(f"Formatting failed: {review['black_preview'].splitlines()[0]}")
+    if review["complexity"].get("error"):
+        raise RuntimeError(f"Complexity analysis failed: {review['complexity']['error']}")
+
+    # The download buttons open both files, so do the same here
+    for path in (review["pdf_path"], review["json_path"]):
+        if not os.path.exists(path):
+            raise RuntimeError(path)
+        with open(path, "rb") as f:
+            data = f.read()
+
+    expected = {k: v for k, v in review.items() if k not in ("pdf_path", "json_path")}
+    if json.loads(data) != expected:
+        raise ReportCollision(f"{os.path.basename(review['json_path'])} was overwritten by another session")
+
+    return review
+
+
+# --------------------------------------------------
+# 3. Resource Probes (stdlib only, /proc on Linux)
+# --------------------------------------------------
+def get_rss_mb():
+    """Returns the current resident memory of this process in MB, or None."""
+    try:
+        with open("/proc/self/statm", "r") as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except (OSError, ValueError, IndexError):
+        pass
+    try:
+        import resource
+        # Peak (not current) RSS: KB on Linux, bytes on macOS
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+    except ImportError:
+        return None
+
+
+def get_open_fds():
+    """Returns the number of open file descriptors, or None if unknown."""
+    for fd_dir in ("/proc/self/fd", "/dev/fd"):
+        if os.path.isdir(fd_dir):
+            return len(os.listdir(fd_dir))
+    return None
+
+
+def list_temp_files():
+    """Returns the analyzer-style temp files (tmp*.py) in the temp folder."""
+    return set(glob.glob(os.path.join(tempfile.gettempdir(), "tmp*.py")))
+
+
+def get_dir_size(path: str):
+    """Returns (file count, size in MB) for a folder."""
+    count, size = 0, 0
+    for root, _, files in os.walk(path):
+        for name in files:
+            try:
+                size += os.path.getsize(os.path.join(root, name))
+                count += 1
+            except OSError:
+                pass  # Removed while we were walking
+    return count, size / (1024 * 1024)
+
+
+def take_snapshot(reports_dir: str) -> dict:
+    """Collects one sample of every tracked resource."""
+    report_files, report_mb = get_dir_size(reports_dir)
+    return {
+        "time": time.monotonic(),
+        "rss_mb": get_rss_mb(),
+        "open_fds": get_open_fds(),
+        "temp_files": len(list_temp_files()),
+        "report_files": report_files,
+        "report_mb": report_mb,
+    }
+
+
+# --------------------------------------------------
+# 4. Load Runner
+# --------------------------------------------------
+def percentile(values, pct: float) -> float:
+    """Nearest-rank percentile of a list of numbers (0 for an empty list)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+class LoadRun:
+    """
+    Runs N session threads against the pipeline and a sampler thread that
+    records resource usage. Streamlit serves every browser session from a
+    thread in one process, so threads match how app.py is deployed.
+    """
+
+    def __init__(self, samples, sessions, duration, warmup, sample_interval, quick, reports_dir,
+                 report_names="app"):
+        self.samples = samples
+        self.sessions = sessions
+        self.duration = duration
+        self.warmup = warmup
+        self.sample_interval = sample_interval
+        self.quick = quick
+        self.reports_dir = reports_dir
+        self.report_names = report_names
+
+        # Compact storage so hours-long runs do not skew the RSS numbers
+        self.latencies = array("d")
+        self.error_count = 0
+        self.error_samples = []
+        self.collision_count = 0
+        self.report_owners = {}
+        self.snapshots = []
+        self.lock = threading.Lock()
+        self.stop_event = threading.Event()
+        self.resume_event = threading.Event()
+        self.busy = 0
+        self.measuring = False
+
+    def _session(self, session_id: int):
+        i = session_id
+        while not self.stop_event.is_set():
+            self.resume_event.wait()
+            with self.lock:
+                if self.stop_event.is_set():
+                    break  # Woken up only to shut down
+                if not self.resume_event.is_set():
+                    continue  # Paused between the wait and the lock
+                self.busy += 1
+
+            name, code = self.samples[i % len(self.samples)]
+            i += 1
+            start = time.perf_counter()
+            try:
+                review = simulate_click(code, self._report_name(session_id, name), quick=self.quick)
+                self._claim_report(review["json_path"], session_id)
+            except ReportCollision as e:
+                with self.lock:
+                    self.collision_count += 1
+                    if len(self.error_samples) < 5:
+                        self.error_samples.append(f"session {session_id} / {name}: {e}")
+            except Exception as e:
+                with self.lock:
+                    self.error_count += 1
+                    if len(self.error_samples) < 5:
+                        self.error_samples.append(f"session {session_id} / {name}: {e}")
+                continue
+            finally:
+                with self.lock:
+                    self.busy -= 1
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            if self.measuring:
+                with self.lock:
+                    self.latencies.append(elapsed_ms)
+
+    def _claim_report(self, path: str, session_id: int):
+        """
+        Records which session wrote a report path. Reports are named by
+        filename and second, so a second session on the same path means one
+        user's download was (or could have been) replaced by another's.
+        """
+        now = time.monotonic()
+        with self.lock:
+            owner = self.report_owners.get(path)
+            self.report_owners[path] = (session_id, now)
+            # Timestamps have one-second resolution, so old paths can be forgotten
+            if len(self.report_owners) > 1000:
+                self.report_owners = {
+                    p: o for p, o in self.report_owners.items() if now - o[1] < 5
+                }
+        if owner and owner[0] != session_id and now - owner[1] < 5:
+            raise ReportCollision(f"{os.path.basename(path)} was also written by session {owner[0]}")
+
+    def _report_name(self, session_id: int, name: str) -> str:
+        """
+        "app" mode names reports the way app.py does: even sessions paste
+        their code (all sharing "manual_input"), odd ones upload the sample
+        file. "unique" gives every session its own names.
+        """
+        if self.report_names == "unique":
+            return f"load_s{session_id}_{name}"
+        return PASTED_FILENAME if session_id % 2 == 0 else name
+
+    def _sampler(self):
+        while not self.stop_event.wait(self.sample_interval):
+            if self.measuring:
+                snap = take_snapshot(self.reports_dir)
+                self.snapshots.append(snap)
+                logger.info(
+                    f"RSS {snap['rss_mb']:.1f} MB | FDs {snap['open_fds']} | "
+                    f"temp files {snap['temp_files']} | reports {snap['report_files']} "
+                    f"({snap['report_mb']:.1f} MB) | requests {len(self.latencies)}"
+                )
+
+    def _quiet_snapshot(self) -> dict:
+        """
+        Pauses every session, waits for in-flight reviews to finish and takes
+        a snapshot, so open subprocess pipes and temp files do not count as growth.
+        """
+        with self.lock:
+            self.resume_event.clear()
+        while True:
+            with self.lock:
+                if self.busy == 0:
+                    break
+            time.sleep(0.05)
+        return take_snapshot(self.reports_dir)
+
+    def run(self) -> dict:
+        temp_before = list_temp_files()
+        threads = [
+            threading.Thread(target=self._session, args=(n,), daemon=True)
+            for n in range(self.sessions)
+        ]
+        sampler = threading.Thread(target=self._sampler, daemon=True)
+
+        self.resume_event.set()
+        for t in threads:
+            t.start()
+        sampler.start()
+
+        # Warm-up: let imports, caches and font loading settle before the baseline
+        time.sleep(self.warmup)
+        baseline = self._quiet_snapshot()
+        self.measuring = True
+        started = time.monotonic()
+        self.resume_event.set()
+
+        try:
+            time.sleep(self.duration)
+        except KeyboardInterrupt:
+            logger.warning("Interrupted - stopping sessions and reporting what we have.")
+
+        self.measuring = False
+        elapsed = time.monotonic() - started
+        final = self._quiet_snapshot()
+
+        self.stop_event.set()
+        self.resume_event.set()
+        for t in threads:
+            t.join()
+        sampler.join()
+        leftover = sorted(list_temp_files() - temp_before)
+        return self._summarize(baseline, final, elapsed, leftover)
+
+    def _summarize(self, baseline, final, elapsed, leftover) -> dict:
+        def growth(key):
+            if baseline[key] is None or final[key] is None:
+                return None
+            return round(final[key] - baseline[key], 2)
+
+        def rounded(value):
+            return round(value, 2) if value is not None else None
+
+        peak_rss = max((s["rss_mb"] for s in self.snapshots if s["rss_mb"] is not None), default=None)
+        return {
+            "sessions": self.sessions,
+            "duration_s": round(elapsed, 1),
+            "requests": len(self.latencies),
+            "errors": self.error_count,
+            "report_collisions": self.collision_count,
+            "error_samples": self.error_samples,
+            "throughput_rps": round(len(self.latencies) / elapsed, 2) if elapsed else 0.0,
+            "latency_ms": {
+                "p50": round(percentile(self.latencies, 50), 1),
+                "p95": round(percentile(self.latencies, 95), 1),
+                "p99": round(percentile(self.latencies, 99), 1),
+                "max": round(max(self.latencies, default=0.0), 1),
+            },
+            "rss_mb": {
+                "baseline": rounded(baseline["rss_mb"]),
+                "final": rounded(final["rss_mb"]),
+                "peak": rounded(peak_rss),
+                "growth": growth("rss_mb"),
+            },
+            "open_fds": {
+                "baseline": baseline["open_fds"],
+                "final": final["open_fds"],
+                "growth": growth("open_fds"),
+            },
+            "leftover_temp_files": leftover,
+            "report_growth": {
+                "files": growth("report_files"),
+                "mb": growth("report_mb"),
+            },
+        }
+
+
+# --------------------------------------------------
+# 5. Bounds Check
+# --------------------------------------------------
+def check_bounds(summary: dict, args) -> list:
+    """
+    Compares the run summary against the configured limits.
+
+    Returns:
+        list: Human readable failure messages (empty when the run passed).
+    """
+    failures = []
+
+    if summary["errors"] > args.max_errors:
+        failures.append(f"{summary['errors']} pipeline errors (limit {args.max_errors})")
+
+    if summary["report_collisions"] > args.max_report_collisions:
+        failures.append(
+            f"{summary['report_collisions']} reports overwritten by another session "
+            f"(limit {args.max_report_collisions})"
+        )
+
+    rss_growth = summary["rss_mb"]["growth"]
+    if rss_growth is not None and rss_growth > args.max_rss_growth_mb:
+        failures.append(f"RSS grew {rss_growth} MB (limit {args.max_rss_growth_mb} MB)")
+
+    fd_growth = summary["open_fds"]["growth"]
+    if fd_growth is not None and fd_growth > args.max_fd_growth:
+        failures.append(f"Open file descriptors grew by {fd_growth} (limit {args.max_fd_growth})")
+
+    leftover = len(summary["leftover_temp_files"])
+    if leftover > args.max_temp_files:
+        failures.append(f"{leftover} temp files left behind (limit {args.max_temp_files})")
+
+    report_mb = summary["report_growth"]["mb"]
+    if args.max_report_growth_mb is not None and report_mb is not None and report_mb > args.max_report_growth_mb:
+        failures.append(f"Reports folder grew {report_mb} MB (limit {args.max_report_growth_mb} MB)")
+
+    p99 = summary["latency_ms"]["p99"]
+    if args.max_p99_ms is not None and p99 > args.max_p99_ms:
+        failures.append(f"p99 latency {p99} ms (limit {args.max_p99_ms} ms)")
+
+    return failures
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Load and soak test the AI Code Reviewer pipeline.")
+    parser.add_argument("--sessions", type=int, default=8, help="Concurrent simulated users (default 8)")
+    parser.add_argument("--duration", type=float, default=60, help="Measured run time in seconds (default 60)")
+    parser.add_argument("--warmup", type=float, default=10,
+                        help="Seconds to run before taking the baseline (default 10)")
+    parser.add_argument("--sample-interval", type=float, default=5, help="Seconds between resource samples (default 5)")
+    parser.add_argument("--quick", action="store_true", help="Use Quick Lint instead of Flake8")
+    parser.add_argument("--reports-dir", default=None,
+                        help="Where generated reports go (default: a scratch folder removed afterwards). "
+                             "Pass output/reports to measure growth of the real folder.")
+    parser.add_argument("--report-names", choices=["app", "unique"], default="app",
+                        help="'app' reuses app.py's report names (manual_input / upload name), so concurrent "
+                             "users can overwrite each other's reports; 'unique' gives each session its own")
+    parser.add_argument("--json-out", default=None, help="Also write the summary to this JSON file")
+
+    bounds = parser.add_argument_group("failure bounds")
+    bounds.add_argument("--max-rss-growth-mb", type=float, default=100)
+    bounds.add_argument("--max-fd-growth", type=int, default=10)
+    bounds.add_argument("--max-temp-files", type=int, default=0)
+    bounds.add_argument("--max-errors", type=int, default=0)
+    bounds.add_argument("--max-report-collisions", type=int, default=0)
+    bounds.add_argument("--max-report-growth-mb", type=float, default=None)
+    bounds.add_argument("--max-p99-ms", type=float, default=None)
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+
+    samples = load_samples()
+    if not samples:
+        logger.error("No sample files found in sample_code/ or test_codes/.")
+        return 1
+
+    # Keep soak runs from filling the real reports folder unless asked to
+    scratch_dir = None
+    if args.reports_dir:
+        reports_dir = os.path.abspath(args.reports_dir)
+        os.makedirs(reports_dir, exist_ok=True)
+    else:
+        scratch_dir = tempfile.mkdtemp(prefix="reviewer_load_")
+        reports_dir = scratch_dir
+    report.OUTPUT_DIR = reports_dir
+
+    logger.info(f"Running {args.sessions} sessions for {args.duration}s on {len(samples)} samples -> {reports_dir}")
+
+    try:
+        summary = LoadRun(
+            samples=samples,
+            sessions=args.sessions,
+            duration=args.duration,
+            warmup=args.warmup,
+            sample_interval=args.sample_interval,
+            quick=args.quick,
+            reports_dir=reports_dir,
+            report_names=args.report_names,
+        ).run()
+    finally:
+        if scratch_dir:
+            shutil.rmtree(scratch_dir, ignore_errors=True)
+
+    failures = check_bounds(summary, args)
+    summary["passed"] = not failures
+    summary["failures"] = failures
+
+    print(json.dumps(summary, indent=4))
+    if args.json_out:
+        with open(args.json_out, "w", encoding="utf-8") as f:
+            json.dump(summary, f, indent=4)
+
+    for failure in failures:
+        logger.error(f"FAIL: {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,60 @@
+# Edge cases for utils/quick_lint.py - checked against Flake8 in tests/test_quick_lint.py
+import os
+
+
+def slices(items,count):
+    head = items[:count]
+    tail = items[count:]
+    step = items[1:count:2]
+    return head, tail, step
+
+
+def defaults(a, b=1, *args, c=None, **kwargs) -> int:
+    total=a+b
+    total +=c or 0
+    return total
+
+
+def positional_only(a, /, b):
+    return a, b
+
+
+def positional_only_last(a, b, /):
+    return lambda x=1, /: x
+
+
+def formatting(value, width):
+    return f"{value:>10}", f"{value=}", f"{value:{width}}", "{0:>4}".format(value)
+
+
+def unary(x, y):
+    a = -x
+    b = x*-y
+    c = x -y
+    d = [-1, +2, ~3]
+    e = not-x
+    return a, b, c, d, e, os.sep
+
+
+def tuples():
+    single = (1,)
+    listed = [1,]
+    mapping = {'a':1,'b':2}
+    return single, listed, mapping
+
+
+if True:
+   suppressed=1  # noqa
+   only_e225=1  # noqa: E225
+   wrong_code=1  # noqa: E231
+   pair = (1,2)  # noqa:E231
+   plugin_code=1  # noqa: ANN001
+   prefix=1  # noqa: E2
+   short_prefix=1  # noqa:E22
+   lowercase=1  # NOQA:e225
+   no_space=1  #noqa
+
+
+docstring_total=1 + len('''
+abc
+''')  # noqa
@@ -0,0 +1,119 @@
+# tests/test_load_harness.py
+
+import os
+import sys
+import json
+
+import pytest
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BASE_DIR)
+
+import load_harness  # noqa: E402
+from utils import analyzer, report  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def reports_dir(tmp_path, monkeypatch):
+    # main() points report.OUTPUT_DIR at its scratch folder - put it back afterwards
+    monkeypatch.setattr(report, "OUTPUT_DIR", str(tmp_path))
+    return tmp_path
+
+
+def run_main(tmp_path, *extra):
+    """Runs a short harness pass and returns (exit code, summary)."""
+    json_out = str(tmp_path / "summary.json")
+    exit_code = load_harness.main([
+        "--sessions", "2", "--duration", "1", "--warmup", "0", "--sample-interval", "0.2",
+        "--json-out", json_out, *extra
+    ])
+    with open(json_out, "r", encoding="utf-8") as f:
+        return exit_code, json.load(f)
+
+
+def test_swallowed_flake8_failure_fails_the_run(tmp_path, monkeypatch):
+    # run_flake8_check() reports failures as a CRITICAL issue instead of raising
+    def broken_run(*args, **kwargs):
+        raise FileNotFoundError("flake8")
+    monkeypatch.setattr(analyzer.subprocess, "run", broken_run)
+
+    exit_code, summary = run_main(tmp_path)
+
+    assert exit_code == 1
+    assert summary["errors"] > 0
+    assert summary["requests"] == 0
+    assert any("pipeline errors" in failure for failure in summary["failures"])
+
+
+def test_percentile_empty():
+    assert load_harness.percentile([], 99) == 0.0
+
+
+def test_percentile_nearest_rank():
+    values = list(range(1, 201))  # 1..200, shuffled order must not matter
+    values.reverse()
+
+    assert load_harness.percentile(values, 99) == 198
+    assert load_harness.percentile(values, 50) == 100
+    assert load_harness.percentile([7.5], 99) == 7.5
+
+
+def passing_summary():
+    """A summary that stays inside every default bound."""
+    return {
+        "errors": 0,
+        "report_collisions": 0,
+        "latency_ms": {"p50": 10.0, "p95": 20.0, "p99": 30.0, "max": 40.0},
+        "rss_mb": {"baseline": 40.0, "final": 41.0, "peak": 41.0, "growth": 1.0},
+        "open_fds": {"baseline": 4, "final": 4, "growth": 0},
+        "leftover_temp_files": [],
+        "report_growth": {"files": 10, "mb": 1.0},
+    }
+
+
+def test_check_bounds_passes():
+    args = load_harness.parse_args(["--max-report-growth-mb", "5", "--max-p99-ms", "100"])
+    assert load_harness.check_bounds(passing_summary(), args) == []
+
+
+@pytest.mark.parametrize("section, key, value, argv, expected", [
+    ("errors", None, 3, [], "pipeline errors"),
+    ("report_collisions", None, 2, [], "overwritten by another session"),
+    ("rss_mb", "growth", 150.0, [], "RSS grew"),
+    ("open_fds", "growth", 25, [], "Open file descriptors grew"),
+    ("leftover_temp_files", None, ["/tmp/tmpabc.py"], [], "temp files left behind"),
+    ("report_growth", "mb", 12.0, ["--max-report-growth-mb", "5"], "Reports folder grew"),
+    ("latency_ms", "p99", 900.0, ["--max-p99-ms", "100"], "p99 latency"),
+])
+def test_check_bounds_failures(section, key, value, argv, expected):
+    summary = passing_summary()
+    if key is None:
+        summary[section] = value
+    else:
+        summary[section][key] = value
+
+    failures = load_harness.check_bounds(summary, load_harness.parse_args(argv))
+
+    assert len(failures) == 1
+    assert expected in failures[0]
+
+
+def test_check_bounds_skips_unknown_measurements():
+    # RSS / FD probes return None on platforms without /proc
+    summary = passing_summary()
+    summary["rss_mb"]["growth"] = None
+    summary["open_fds"]["growth"] = None
+
+    assert load_harness.check_bounds(summary, load_harness.parse_args([])) == []
+
+
+def test_main_smoke(tmp_path):
+    exit_code, summary = run_main(tmp_path)
+
+    assert exit_code == 0, summary["failures"]
+    assert summary["passed"] is True
+    assert summary["requests"] > 0
+    for key in ("sessions", "duration_s", "errors", "report_collisions", "throughput_rps",
+                "latency_ms", "rss_mb", "open_fds", "leftover_temp_files", "report_growth"):
+        assert key in summary
+    assert set(summary["latency_ms"]) == {"p50", "p95", "p99", "max"}
@@ -0,0 +1,68 @@
+# tests/test_quick_lint.py
+
+import os
+import re
+import sys
+import glob
+import subprocess
+
+import pytest
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BASE_DIR)
+
+from utils.quick_lint import QUICK_CODES, run_quick_check  # noqa: E402
+
+# Same "file:line:col: code message" format utils/analyzer.py parses
+PARSE_PATTERN = re.compile(r":(\d+):(\d+):\s([A-Z]\d+)\s(.*)")
+
+EDGE_CASES_FILE = os.path.join(BASE_DIR, "tests", "fixtures", "quick_lint_edge_cases.py")
+
+SAMPLE_FILES = sorted(
+    glob.glob(os.path.join(BASE_DIR, "sample_code", "*.py"))
+    + glob.glob(os.path.join(BASE_DIR, "test_codes", "*.py"))
+) + [EDGE_CASES_FILE]
+
+
+def flake8_issues(path: str) -> list:
+    """Runs Flake8 with the app's settings, limited to the quick lint codes."""
+    result = subprocess.run(
+        [sys.executable, "-m", "flake8", path, "--isolated", "--max-line-length=120",
+         f"--select={','.join(QUICK_CODES)}"],
+        capture_output=True,
+        text=True,
+        encoding="utf-8"
+    )
+    issues = []
+    for line in result.stdout.splitlines():
+        match = PARSE_PATTERN.search(line)
+        if match:
+            line_no, col_no, err_code, err_msg = match.groups()
+            issues.append({
+                "line": int(line_no),
+                "column": int(col_no),
+                "code": err_code,
+                "message": err_msg.strip()
+            })
+    return issues
+
+
+@pytest.mark.parametrize("path", SAMPLE_FILES, ids=os.path.basename)
+def test_matches_flake8(path):
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        code_text = f.read()
+
+    assert run_quick_check(code_text) == flake8_issues(path)
+
+
+def test_edge_cases_report_something():
+    # Guards against both sides silently returning nothing
+    with open(EDGE_CASES_FILE, "r", encoding="utf-8") as f:
+        codes = {issue["code"] for issue in run_quick_check(f.read())}
+
+    assert codes == set(QUICK_CODES)
+
+
+def test_empty_and_untokenizable_input():
+    assert run_quick_check("") == []
+    assert run_quick_check("x = (1,\n") == []
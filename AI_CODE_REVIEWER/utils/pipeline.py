@@ -0,0 +1,59 @@
+# utils/pipeline.py
+
+from utils.analyzer import run_flake8_check
+from utils.quick_lint import run_quick_check
+from utils.formatter import run_black_format
+from utils.complexity import run_complexity_analysis
+from utils import report
+
+
+def run_review(code_text: str, filename: str, quick_lint: bool = False, progress=None) -> dict:
+    """
+    Runs one full review: style check, formatting, complexity and the
+    PDF / JSON exports. This is what the "Analyze & Optimize" button does,
+    and load_harness.py calls it directly so both measure the same path.
+
+    Args:
+        code_text (str): The Python source code to review.
+        filename (str): Base name used for the generated reports.
+        quick_lint (bool): Use the Quick Lint check (E111, E225, E231) instead of Flake8.
+        progress (callable): Optional progress(percent, text) callback for the UI.
+
+    Returns:
+        dict: The aggregated results plus "pdf_path" and "json_path" of the exports.
+    """
+    def report_progress(percent, text):
+        if progress:
+            progress(percent, text)
+
+    # 1. Run Style Check (Quick Lint skips the Flake8 subprocess for fast previews)
+    if quick_lint:
+        report_progress(30, "Checking Style Guidelines (Quick Lint: E111, E225, E231)...")
+        style_issues = run_quick_check(code_text)
+    else:
+        report_progress(30, "Checking Style Guidelines (Flake8)...")
+        style_issues = run_flake8_check(code_text)
+
+    # 2. Run Formatting
+    report_progress(60, "Formatting Code (Black)...")
+    formatted_code = run_black_format(code_text)
+
+    # 3. Run Complexity
+    report_progress(90, "Calculating Cognitive Complexity (Radon)...")
+    complexity_data = run_complexity_analysis(code_text)
+
+    # Aggregate results
+    full_results = {
+        "style_issues": style_issues,
+        "complexity": complexity_data,
+        "black_preview": formatted_code,
+        "quick_lint": quick_lint
+    }
+
+    # 4. Generate export files
+    report_progress(95, "Generating Reports...")
+    pdf_path = report.save_as_pdf(code_text, formatted_code, full_results, filename)
+    json_path = report.save_as_json(full_results, filename)
+
+    report_progress(100, "Analysis Complete!")
+    return {**full_results, "pdf_path": pdf_path, "json_path": json_path}
@@ -0,0 +1,269 @@
+# utils/quick_lint.py
+
+import io
+import re
+import keyword
+import tokenize
+import logging
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Codes this fast path reports - the bulk of what Flake8 finds in our reports
+QUICK_CODES = ("E111", "E225", "E231")
+
+# Token groups mirrored from pycodestyle so results line up with Flake8
+NEWLINE_TOKENS = frozenset([tokenize.NL, tokenize.NEWLINE])
+SKIP_TOKENS = NEWLINE_TOKENS.union([tokenize.INDENT, tokenize.DEDENT])
+SKIP_COMMENTS = SKIP_TOKENS.union([tokenize.COMMENT, tokenize.ERRORTOKEN])
+OPERATOR_TYPES = (tokenize.OP, tokenize.NAME)
+
+# f-string tokens only exist on Python 3.12+
+FSTRING_START = getattr(tokenize, "FSTRING_START", None)
+FSTRING_END = getattr(tokenize, "FSTRING_END", None)
+
+KEYWORDS = frozenset(keyword.kwlist + ["print"]) - frozenset(["False", "None", "True"])
+UNARY_OPERATORS = frozenset([">>", "**", "*", "+", "-"])
+ARITHMETIC_OP = frozenset(["**", "*", "/", "//", "+", "-", "@"])
+WS_OPTIONAL_OPERATORS = ARITHMETIC_OP.union(["^", "&", "|", "<<", ">>", "%"])
+WS_NEEDED_OPERATORS = frozenset([
+    "**=", "*=", "/=", "//=", "+=", "-=", "!=", "<", ">",
+    "%=", "^=", "&=", "|=", "==", "<=", ">=", "<<=", ">>=", "=",
+    "and", "in", "is", "or", "->", ":="])
+WHITESPACE = frozenset(" \t\xa0")
+
+# Flake8's NOQA_INLINE_REGEXP: "# noqa", "# noqa: E231,E225", "# NOQA:E2,SIM102"
+NOQA_PATTERN = re.compile(r"# noqa(?::[\s]?(?P<codes>([A-Z]+[0-9]+(?:[,\s]+)?)+))?", re.I)
+
+MESSAGES = {
+    "E111": "indentation is not a multiple of 4",
+    "E225": "missing whitespace around operator",
+}
+
+
+def _expand_indent(line: str) -> int:
+    """Returns the indent width of a line, expanding tabs to 8 columns."""
+    line = line.rstrip("\n\r")
+    if "\t" not in line:
+        return len(line) - len(line.lstrip())
+    result = 0
+    for char in line:
+        if char == "\t":
+            result = result // 8 * 8 + 8
+        elif char == " ":
+            result += 1
+        else:
+            break
+    return result
+
+
+def _check_indentation(tokens, lines):
+    """
+    E111: the logical line does not start on a multiple of 4 columns.
+    Comment-only lines are E114 in Flake8, so they are skipped here.
+    """
+    first = None
+    for token_type, _, start, _, _ in tokens:
+        if token_type in SKIP_TOKENS:
+            continue
+        if first is None:
+            first = start
+        if token_type not in (tokenize.COMMENT, tokenize.ENDMARKER):
+            break
+    else:
+        return
+
+    row, col = first
+    if _expand_indent(lines[row - 1][:col]) % 4:
+        yield first, "E111", MESSAGES["E111"]
+
+
+def _check_whitespace(tokens):
+    """
+    E225 / E231: missing whitespace around operators and after , ; :
+    Ported from pycodestyle's missing_whitespace() check.
+    """
+    need_space = False
+    prev_type = tokenize.OP
+    prev_text = prev_end = None
+    brace_stack = []
+
+    for token_type, text, start, end, line in tokens:
+        # 1. Track what kind of bracket (or lambda) we are inside
+        if token_type == tokenize.OP and text in {"[", "(", "{"}:
+            brace_stack.append(text)
+        elif FSTRING_START is not None and token_type == FSTRING_START:
+            brace_stack.append("f")
+        elif token_type == tokenize.NAME and text == "lambda":
+            brace_stack.append("l")
+        elif brace_stack:
+            if token_type == tokenize.OP and text in {"]", ")", "}"}:
+                brace_stack.pop()
+            elif FSTRING_END is not None and token_type == FSTRING_END:
+                brace_stack.pop()
+            elif brace_stack[-1] == "l" and token_type == tokenize.OP and text == ":":
+                brace_stack.pop()
+
+        if token_type in SKIP_COMMENTS:
+            continue
+
+        # 2. E231 - separators must be followed by whitespace
+        if token_type == tokenize.OP and text in {",", ";", ":"}:
+            next_char = line[end[1]:end[1] + 1]
+            if next_char not in WHITESPACE and next_char not in "\r\n":
+                if text == ":" and brace_stack[-1:] == ["["]:
+                    pass  # slice
+                elif text == ":" and brace_stack[-2:] == ["f", "{"]:
+                    pass  # f-string format specifier
+                elif text == "," and next_char in ")]":
+                    pass  # one-element tuple
+                else:
+                    yield start, "E231", f"missing whitespace after {text!r}"
+
+        # 3. E225 - operators that need a space on both sides
+        if need_space:
+            if start != prev_end:
+                if need_space is not True and not need_space[1]:
+                    yield need_space[0], "E225", MESSAGES["E225"]
+                need_space = False
+            elif prev_text == "/" and text in {",", ")", ":"} or prev_text == ")" and text == ":":
+                # Positional-only marker in a signature (PEP 570)
+                pass
+            else:
+                if need_space is True or need_space[1]:
+                    yield prev_end, "E225", MESSAGES["E225"]
+                # E226-E228 are ignored by Flake8's defaults, so nothing to report
+                need_space = False
+        elif token_type in OPERATOR_TYPES and prev_end is not None:
+            if text == "=" and (
+                brace_stack[-1:] == ["l"]
+                or brace_stack[-1:] == ["("]
+                or brace_stack[-2:] == ["f", "{"]
+            ):
+                pass  # keyword argument or default value
+            elif text in WS_NEEDED_OPERATORS:
+                need_space = True
+            elif text in UNARY_OPERATORS:
+                # Binary usage only: -x, *args and **kwargs are fine
+                if prev_type == tokenize.OP and prev_text in "}])" or (
+                    prev_type != tokenize.OP
+                    and prev_text not in KEYWORDS
+                    and not keyword.issoftkeyword(prev_text)
+                ):
+                    need_space = None
+            elif text in WS_OPTIONAL_OPERATORS:
+                need_space = None
+
+            if need_space is None:
+                # Optional space, but it must match on both sides
+                need_space = (prev_end, start != prev_end)
+            elif need_space and start == prev_end:
+                yield prev_end, "E225", MESSAGES["E225"]
+                need_space = False
+
+        prev_type = token_type
+        prev_text = text
+        prev_end = end
+
+
+def _is_suppressed(line: str, code: str) -> bool:
+    """
+    Checks whether the noqa text for a line silences the given code.
+    Listed codes act as prefixes, so '# noqa: E2' covers E225 like in Flake8.
+    """
+    match = NOQA_PATTERN.search(line)
+    if not match:
+        return False
+    codes = match.group("codes")
+    if not codes:
+        return True
+    prefixes = tuple(c for c in re.split(r"[,\s]+", codes) if c)
+    return code.startswith(prefixes)
+
+
+def run_quick_check(code_text: str):
+    """
+    Lightweight alternative to run_flake8_check() for live previews.
+
+    Makes a single tokenize pass in-process (no temp file, no subprocess)
+    and reports only the most frequent pycodestyle codes: E111, E225, E231.
+    Results use the same dict format and positions as Flake8.
+
+    A '# noqa' comment applies to every physical line of the token run it
+    ends, so one after a multi-line string covers the whole string, as in Flake8.
+
+    Code that fails to tokenize returns no issues - the full Flake8 run
+    is responsible for reporting syntax errors (E999).
+
+    Args:
+        code_text (str): The Python source code to analyze.
+
+    Returns:
+        list: A list of dictionaries containing error details (line, col, code, message).
+    """
+    issues = []
+
+    # Safety check for empty input
+    if not code_text or not code_text.strip():
+        return issues
+
+    lines = code_text.splitlines(keepends=True)
+    found = []
+    logical = []
+    parens = 0
+
+    # Line number -> text searched for "# noqa" (Flake8's noqa line mapping)
+    noqa_lines = {}
+    min_line, max_line = len(lines) + 2, -1
+
+    try:
+        # Group tokens into logical lines, the same way pycodestyle does
+        for token in tokenize.generate_tokens(io.StringIO(code_text).readline):
+            logical.append(token)
+            token_type, text = token[0:2]
+
+            if token_type not in (tokenize.ENDMARKER, tokenize.DEDENT):
+                min_line = min(min_line, token[2][0])
+                max_line = max(max_line, token[3][0])
+                if token_type in NEWLINE_TOKENS:
+                    joined = "".join(lines[min_line - 1:max_line])
+                    noqa_lines.update(dict.fromkeys(range(min_line, max_line + 1), joined))
+                    min_line, max_line = len(lines) + 2, -1
+
+            if token_type == tokenize.OP:
+                if text in "([{":
+                    parens += 1
+                elif text in "}])":
+                    parens -= 1
+            elif not parens and token_type in NEWLINE_TOKENS:
+                if token_type == tokenize.NL and len(logical) == 1:
+                    # Blank line
+                    logical = []
+                    continue
+                found.extend(_check_indentation(logical, lines))
+                found.extend(_check_whitespace(logical))
+                logical = []
+
+        if logical:
+            found.extend(_check_indentation(logical, lines))
+            found.extend(_check_whitespace(logical))
+
+    except (tokenize.TokenError, SyntaxError) as e:
+        logger.info(f"Quick check skipped, code does not tokenize: {e}")
+        return []
+
+    for (line_no, col_no), err_code, err_msg in found:
+        source_line = lines[line_no - 1] if line_no <= len(lines) else ""
+        if _is_suppressed(noqa_lines.get(line_no, source_line), err_code):
+            continue
+        issues.append({
+            "line": line_no,
+            "column": col_no + 1,
+            "code": err_code,
+            "message": err_msg
+        })
+
+    # Flake8 reports in (line, column) order
+    issues.sort(key=lambda issue: (issue["line"], issue["column"]))
+    return issues
@@ -49,6 +49,8 @@ def save_as_text(data, filename="report"):
             # --- STYLE SECTION ---
             f.write(f"STYLE ISSUES ({len(data.get('style_issues', []))} found)\n")
             f.write("-" * 20 + "\n")
+            if data.get("quick_lint"):
+                f.write("Quick Lint: only E111, E225 and E231 were checked.\n")
             for issue in data.get("style_issues", []):
                 if "error" in issue:
                     f.write(f"CRITICAL ERROR: {issue['error']}\n")
@@ -124,10 +126,16 @@ def save_as_pdf(original_code, formatted_code, analysis_results, filename="repor
             pdf.ln()
 
         # 2. Style Issues
-        add_section_title("2. Style Issues (Flake8)")
+        quick_lint = analysis_results.get("quick_lint", False)
+        if quick_lint:
+            add_section_title("2. Style Issues (Quick Lint)")
+            pdf.cell(0, 6, "Partial check: only E111, E225 and E231 were checked.", ln=True)
+        else:
+            add_section_title("2. Style Issues (Flake8)")
         issues = analysis_results.get("style_issues", [])
         if not issues:
-            pdf.cell(0, 6, "No style issues found. Good job!", ln=True)
+            if not quick_lint:
+                pdf.cell(0, 6, "No style issues found. Good job!", ln=True)
         else:
             for issue in issues:
                 text = f"[Line {issue['line']}] {issue['code']}: {issue['message']}"